@@ -54,49 +54,28 @@ def generate_upload_params(file_name):
     return {}
 
 
-def get_map_seq_md5_v1(mappath, seqpath):
-    md5_hash1 = hashlib.md5()
-    with open(mappath, 'rb') as file1:
-        while True:
-            data = file1.read(1024 * 10)
-            if not data:
-                break
-            md5_hash1.update(data)
-    
-    md5_hash2 = hashlib.md5()
-    with open(seqpath, 'rb') as file2:
+def file_md5(path):
+    md5_hash = hashlib.md5()
+    with open(path, 'rb') as f:
         while True:
-            data = file2.read(1024 * 10)
+            data = f.read(1024 * 1024)
             if not data:
                 break
-            md5_hash2.update(data)
-    
-    md51 = md5_hash1.digest() 
-    md52 = md5_hash2.digest()
+            md5_hash.update(data)
+    return md5_hash
+
+
+def get_map_seq_md5_v1(mappath, seqpath):
+    md51 = file_md5(mappath).digest()
+    md52 = file_md5(seqpath).digest()
     total_md5 = hashlib.md5(md51 + md52).hexdigest()
 
     return total_md5
 
 
 def get_map_seq_md5(mappath, seqpath):
-    md5_hash1 = hashlib.md5()
-    with open(mappath, 'rb') as file1:
-        while True:
-            data = file1.read(1024 * 10)
-            if not data:
-                break
-            md5_hash1.update(data)
-    
-    md5_hash2 = hashlib.md5()
-    with open(seqpath, 'rb') as file2:
-        while True:
-            data = file2.read(1024 * 10)
-            if not data:
-                break
-            md5_hash2.update(data)
-    
-    md51 = md5_hash1.hexdigest()
-    md52 = md5_hash2.hexdigest()
+    md51 = file_md5(mappath).hexdigest()
+    md52 = file_md5(seqpath).hexdigest()
     code = md51 + md52
     total_md5 = hashlib.md5(code.encode('utf-8')).hexdigest()
 
@@ -143,7 +122,6 @@ def create_job(map_name, map_file, seq_file):
     job_id = response.json()['jobid']
     return job_id
   else:
-    # print(f'Failed in creating job\n', json.dumps(response.json(), indent=2))
     print(f'Failed in creating job\n', jdata['msg'])
     sys.exit()
 
@@ -176,7 +154,6 @@ def check_job(job_id):
 
 def check_md5(mappath, seqpath):
     jmd5 = get_map_seq_md5(mappath, seqpath)
-    print(jmd5)
     response = requests.get(f'{check_md5_url}?md5={jmd5}', verify=False)
     if response.status_code == 200:
         obj = response.json()